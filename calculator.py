@@ -24,9 +24,11 @@ apply_main_page_styling()
 
 st.markdown("### 💰 Disposable Income Calculator")
 
-# --- Load options from database.py
+# --- Load options from database.py (kept for the session; an empty result is retried)
 
-opts = load_options(DB_URI)
+if not any(st.session_state.get("opts", {}).values()):
+    st.session_state["opts"] = load_options(DB_URI)
+opts = st.session_state["opts"]
 if not any(opts.values()):
     st.error("I cannot find the database, or the tables are empty. Please ensure that you have created it and uploaded the JSONs.")
     st.stop()
@@ -1,14 +1,98 @@
-import sqlite3
-from pathlib import Path
-from typing import Dict, Any, Optional
-import sqlite3
-from pathlib import Path
+import streamlit as st
+from typing import Dict, Any, Optional, Tuple
+from core.database import read_connection, db_version
 
 DB_URI = "sqlite:///db/app.db"
 
 
 # ---------- Cost calculations ---------- #
 
+# Per-click lookups, in one statement:
+#   - rent: best matching row (found = 1 when it exists)
+#   - rent component of the essential costs
+_ESTIMATES_SQL = """
+    WITH
+      rent AS (
+        SELECT 1 AS found, rp.min_amount, rp.average_amount, rp.max_amount
+        FROM rental_prices AS rp
+        JOIN period  AS p ON rp.period_id   = p.id
+        JOIN currency AS c ON rp.currency_id = c.id
+        WHERE rp.city               = :city COLLATE NOCASE
+          AND rp.accommodation_type = :accommodation_type COLLATE NOCASE
+          AND p.type = 'monthly'
+          AND c.currency_code = 'EUR'
+        ORDER BY rp.average_amount DESC
+        LIMIT 1
+      )
+    SELECT
+      rent.found AS rent_found, rent.min_amount AS rent_min, rent.average_amount AS rent_avg, rent.max_amount AS rent_max,
+      (SELECT AVG(average_amount) FROM rental_prices
+        WHERE city = :city AND accommodation_type = :accommodation_type) AS ess_rent
+    FROM (SELECT 1)
+    LEFT JOIN rent ON 1
+"""
+
+
+# The joined salary view (positions x descriptions x period x currency) is a
+# few dozen rows: materialise it once instead of joining four tables per click.
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_salary_table(db_uri: str, db_mtime: int) -> Dict[Tuple[str, str], Tuple[float, float, float]]:
+    with read_connection(db_uri) as con:
+        rows = con.execute("""
+            SELECT jps.position_name, jps.seniority,
+                   jpd.min_amount, jpd.average_amount, jpd.max_amount
+            FROM job_position_descriptions AS jpd
+            JOIN job_positions_seniorities AS jps ON jpd.position_seniority_id = jps.id
+            JOIN period  AS p ON jpd.period_id   = p.id
+            JOIN currency AS c ON jpd.currency_id = c.id
+            WHERE p.type = 'monthly'
+              AND c.currency_code = 'EUR'
+            ORDER BY jpd.average_amount DESC;
+        """).fetchall()
+
+    salaries: Dict[Tuple[str, str], Tuple[float, float, float]] = {}
+    for position_name, seniority, sal_min, sal_avg, sal_max in rows:
+        # Case-insensitive key; the highest average wins, as with ORDER BY ... LIMIT 1
+        salaries.setdefault((position_name.lower(), seniority.lower()), (sal_min, sal_avg, sal_max))
+    return salaries
+
+
+# Utilities, health insurance and car costs are small reference tables that do
+# not depend on the user's selection: read them once and serve from memory.
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_reference_tables(db_uri: str, db_mtime: int) -> Dict[str, Any]:
+    with read_connection(db_uri) as con:
+        utilities_breakdown = {
+            utility_type: amount
+            for utility_type, amount in con.execute("""
+                SELECT utility_type, SUM(amount)
+                FROM utilities
+                GROUP BY utility_type;
+            """)
+        }
+        utilities_total, health_avg, health_value = con.execute("""
+            SELECT (SELECT SUM(amount) FROM utilities),
+                   (SELECT AVG(amount) FROM health_insurance),
+                   (SELECT amount FROM health_insurance LIMIT 1);
+        """).fetchone()
+        car_costs: Dict[str, float] = {}
+        for car_type, total_per_month in con.execute("""
+            SELECT type, total_per_month
+            FROM transportation_car_costs
+            ORDER BY id;
+        """):
+            # Case-insensitive like the former COLLATE NOCASE lookup; first row wins
+            car_costs.setdefault(car_type.lower(), total_per_month)
+
+    return {
+        "utilities_breakdown": utilities_breakdown,
+        "utilities_total": utilities_total,
+        "health_insurance_avg": health_avg,
+        "health_insurance_value": health_value,
+        "car_costs": car_costs,
+    }
+
+
 def get_estimates(
     job: str,
     seniority: str,
@@ -23,69 +107,62 @@ def get_estimates(
       - salary: {min, avg, max}
       - rent:   {min, avg, max}
       - car:    total_per_month (o 0 si no se pide)
+      - essential_costs, utilities_breakdown, health_insurance_value
     Lanza ValueError con mensaje claro si falta algún dato.
+    Cached per input combination and DB file version: every widget change
+    reruns the page, and a replaced data/app.db is picked up right away.
     """
-    with _open(db_uri) as con:
-        # 1) Salary
-        row = con.execute(
-            """
-            SELECT jpd.min_amount, jpd.average_amount, jpd.max_amount
-            FROM job_position_descriptions AS jpd
-            JOIN job_positions_seniorities AS jps ON jpd.position_seniority_id = jps.id
-            JOIN period  AS p ON jpd.period_id   = p.id
-            JOIN currency AS c ON jpd.currency_id = c.id
-            WHERE jps.position_name = ? COLLATE NOCASE
-              AND jps.seniority     = ? COLLATE NOCASE
-              AND p.type = 'monthly'
-              AND c.currency_code = 'EUR'
-            ORDER BY jpd.average_amount DESC
-            LIMIT 1
-            """,
-            (job, seniority),
-        ).fetchone()
-        if not row:
-            raise ValueError(f"No salary found for ({job}, {seniority}) in EUR/month.")
-        sal_min, sal_avg, sal_max = map(lambda x: float(x or 0), row)
+    return _get_estimates_cached(
+        job, seniority, city, accommodation_type, car_type,
+        db_uri=db_uri, db_mtime=db_version(db_uri),
+    )
 
-        # 2) Rent
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _get_estimates_cached(
+    job: str,
+    seniority: str,
+    city: str,
+    accommodation_type: str,
+    car_type: Optional[str],
+    *,
+    db_uri: str,
+    db_mtime: int,
+) -> Dict[str, Any]:
+    with read_connection(db_uri) as con:
         row = con.execute(
-            """
-            SELECT rp.min_amount, rp.average_amount, rp.max_amount
-            FROM rental_prices AS rp
-            JOIN period  AS p ON rp.period_id   = p.id
-            JOIN currency AS c ON rp.currency_id = c.id
-            WHERE rp.city               = ? COLLATE NOCASE
-              AND rp.accommodation_type = ? COLLATE NOCASE
-              AND p.type = 'monthly'
-              AND c.currency_code = 'EUR'
-            ORDER BY rp.average_amount DESC
-            LIMIT 1
-            """,
-            (city, accommodation_type),
+            _ESTIMATES_SQL,
+            {
+                "city": city,
+                "accommodation_type": accommodation_type,
+            },
         ).fetchone()
-        if not row:
-            raise ValueError(f"No rent found for ({city}, {accommodation_type}) in EUR/month.")
-        rent_min, rent_avg, rent_max = map(lambda x: float(x or 0), row)
-
-        # 3) Car (optional)
-        car_month = 0.0
-        if car_type:
-            row = con.execute(
-                """
-                SELECT total_per_month
-                FROM transportation_car_costs
-                WHERE type = ? COLLATE NOCASE
-                LIMIT 1
-                """,
-                (car_type,),
-            ).fetchone()
-            if not row:
-                raise ValueError(f"No car cost found for type '{car_type}'.")
-            car_month = float(row[0] or 0)
-
-    essential_costs = get_essential_costs(con, city, accommodation_type, car_type)
-    utilities_breakdown = get_utilities_breakdown(con)
-    health_insurance_value = get_health_insurance_value(con)
+    ref = _load_reference_tables(db_uri, db_mtime)
+
+    # 1) Salary
+    salary = _load_salary_table(db_uri, db_mtime).get((job.lower(), seniority.lower()))
+    if not salary:
+        raise ValueError(f"No salary found for ({job}, {seniority}) in EUR/month.")
+    sal_min, sal_avg, sal_max = map(lambda x: float(x or 0), salary)
+
+    # 2) Rent
+    if not row["rent_found"]:
+        raise ValueError(f"No rent found for ({city}, {accommodation_type}) in EUR/month.")
+    rent_min, rent_avg, rent_max = map(lambda x: float(x or 0), (row["rent_min"], row["rent_avg"], row["rent_max"]))
+
+    # 3) Car (optional)
+    car_month = 0.0
+    if car_type:
+        if car_type.lower() not in ref["car_costs"]:
+            raise ValueError(f"No car cost found for type '{car_type}'.")
+        car_month = float(ref["car_costs"][car_type.lower()] or 0)
+
+    # 4) Essential costs: rent + utilities + car (si aplica) + health insurance
+    essential_costs = sum(
+        (v or 0 for v in (row["ess_rent"], ref["utilities_total"], car_month, ref["health_insurance_avg"])), 0.0
+    )
+    utilities_breakdown = ref["utilities_breakdown"]
+    health_insurance_value = ref["health_insurance_value"]
 
     return {
         "inputs": {
@@ -104,81 +181,3 @@ def get_estimates(
             "utilities_breakdown": utilities_breakdown,
         },
     }
-
-# Open SQL data
-
-def _open(db_uri: str) -> sqlite3.Connection:
-    assert db_uri.startswith("sqlite:///")
-    path = db_uri.replace("sqlite:///", "", 1)
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(path)
-    con.execute("PRAGMA foreign_keys = ON;")
-    return con
-
-# Getting costs
-
-def get_essential_costs(con: sqlite3.Connection, city: str, accommodation_type: str, car_type: Optional[str]) -> float:
-    total = 0.0
-
-    # --- 1) Rent ---
-    rent = con.execute("""
-        SELECT AVG(average_amount)
-        FROM rental_prices
-        WHERE city = ? AND accommodation_type = ?;
-    """, (city, accommodation_type)).fetchone()[0]
-    total += rent or 0
-
-    # --- 2) Utilities (sumar todas las categorías) ---
-    utilities = con.execute("""
-        SELECT SUM(amount)
-        FROM utilities;
-    """).fetchone()[0]
-    total += utilities or 0
-
-    # --- 3) Car costs (si aplica) ---
-    if car_type:
-        car = con.execute("""
-            SELECT AVG(total_per_month)
-            FROM transportation_car_costs
-            WHERE type = ?;
-        """, (car_type,)).fetchone()[0]
-        total += car or 0
-
-    # --- 4) Health insurance ---
-    hi = con.execute("""
-        SELECT AVG(amount)
-        FROM health_insurance;
-    """).fetchone()[0]
-    total += hi or 0
-
-    return total
-
-# Get utilities cost
-
-def get_utilities_breakdown(con: sqlite3.Connection) -> Dict[str, float]:
-    """
-    Devuelve un dict con los valores de utilities separados por categoría:
-    { "Water": 25.9, "Gas": 50.0, "Electricity": 80.0 }
-    """
-    rows = con.execute("""
-        SELECT utility_type, SUM(amount)
-        FROM utilities
-        GROUP BY utility_type;
-    """).fetchall()
-
-    breakdown = {row[0]: row[1] for row in rows}
-    return breakdown
-
-
-# Get health insutance amount
-def get_health_insurance_value(con: sqlite3.Connection):
-    """
-    Devuelve el valor de health insurance (si solo hay un registro en la tabla).
-    """
-    row = con.execute("""
-        SELECT amount
-        FROM health_insurance
-        LIMIT 1;
-    """).fetchone()
-
-    return row[0]
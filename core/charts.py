@@ -1,12 +1,44 @@
 # ---------- Import packages and libraries ---------- #
 
-import pandas as pd
+import numpy as np
 import streamlit as st
 import plotly.express as px
 import plotly.graph_objects as go
-from core.tax import calc_tax, bereken_algemene_heffingskorting, bereken_arbeidskorting
+from core.tax import build_income_frame
 from typing import List
 
+# ---------- Chart constants ---------- #
+
+# Labels for the bars (first 6 years, 2026 - 2031+)
+_CUSTOM_LABELS = (
+    "30% (2026)",
+    "27% (2027)",
+    "27% (2028)",
+    "27% (2029)",
+    "27% (2030)",
+    "Normal Tax (2031)",
+)
+
+# Clean color palette for the bar chart
+_COLOR_PALETTE_BARS = (
+    "#1C6EB6",
+    "#61AFF3",
+    "#61AFF3",
+    "#61AFF3",
+    "#61AFF3",
+    "#ADE8F4",
+)
+
+# Color palette for the pie chart
+_COLOR_PALETTE_PIE = (
+    "#48CAE4",
+    "#00B4D8",
+    "#0096C7",
+    "#0077B6",
+    "#023E8A",
+    "#03045E",
+)
+
 # ---------- Chart functions ---------- #
 
 def chart_netincome(my_dict: dict, fixed_costs, age, gross_salary, master_dpl):
@@ -22,32 +54,9 @@ def chart_netincome(my_dict: dict, fixed_costs, age, gross_salary, master_dpl):
         master_dpl (bool): True if they have a Master's degree, False otherwise.
     """
 
-    # --- Data Preparation
-
-    # 1. Convert the dictionary to a Pandas DataFrame
-    df = pd.DataFrame(list(my_dict.items()), columns=["Year", "Taxable Income"])
-
-    # 2. Add fixed costs to the DataFrame
-    df["Fixed Costs"] = fixed_costs
-
-    # 3. Calculate taxes and deductions
-    df["Tax"] = round(-df["Taxable Income"].apply(calc_tax), 0)
-    df["Arbeidskorting"] = round(df["Taxable Income"].apply(bereken_arbeidskorting), 0)
-    df["Algemene Heffingskorting"] = round(df["Taxable Income"].apply(bereken_algemene_heffingskorting), 0)
-    df["Gross Salary"] = gross_salary
-
-    # 4. Calculate net tax
-    df["Net Tax"] = - (abs(df["Tax"]) - (df["Arbeidskorting"] + df["Algemene Heffingskorting"]))
+    # --- Eligibility (checked first: nothing is built for ineligible users)
 
-    # 5. Calculate net disposable income after tax and expenses
-    df["Netto Disposable"] = df["Gross Salary"] + df["Net Tax"] - df["Fixed Costs"]
-
-    df.loc[df["Netto Disposable"] < 0, "Netto Disposable"] = 0
-
-
-    # --- Chart preparation and visualization
-
-    # 1. Check eligibility (does the 30% rule apply?)
+    # 1. Does the 30% rule apply?
     eligible = False
     if age >= 30 and gross_salary >= 46660:
         eligible = True
@@ -55,76 +64,51 @@ def chart_netincome(my_dict: dict, fixed_costs, age, gross_salary, master_dpl):
         eligible = True
 
     if not eligible:
-        print("You are not eligible to view the chart based on the criteria.")
-        return # Exit the function if not eligible
-
-    # 2. Prepare the data and create the chart
-    plot_df = df[['Year', 'Netto Disposable', 'Fixed Costs', 'Net Tax']].copy()
-
-    # 3. Display the values from years 2026 - 2031+
-    plot_df = plot_df.head(6)
-
-    # 4. Define custom labels and add to column
-    custom_labels = [
-        "30% (2026)",
-        "27% (2027)",
-        "27% (2028)",
-        "27% (2029)",
-        "27% (2030)",
-        "Normal Tax (2031)",
-    ]
+        return # Exit the function if not eligible (nothing to chart)
 
-    plot_df['Custom Label'] = custom_labels
-    plot_df['Net Tax'] = plot_df['Net Tax'].abs()
 
-    # 5. Convert to monthly values and ensure a numeric type
-    numeric_cols = ['Netto Disposable', 'Fixed Costs', 'Net Tax']
-    for col in numeric_cols:
-        plot_df[col] = pd.to_numeric(plot_df[col], errors='coerce') / 12
-    plot_df = plot_df.fillna(0)
+    # --- Data Preparation
 
-    # 6. Calculate the total monthly income for annotations
-    plot_df['Total'] = plot_df['Netto Disposable'] + plot_df['Fixed Costs'] + plot_df['Net Tax']
+    # 1. Shared tax frame (taxable income, fixed costs, tax, credits, net tax),
+    #    first 6 years (2026 - 2031+) as plain arrays for Plotly
+    df = build_income_frame(tuple(my_dict.items()), fixed_costs, gross_salary).head(6)
+    net_tax = df["Net Tax"].to_numpy(dtype=float)
+    fixed = df["Fixed Costs"].to_numpy(dtype=float)
 
-    # 7. Create the stacked bar chart with Plotly
-    fig = go.Figure()
+    # 2. Monthly net disposable income after tax and expenses (never below 0)
+    net_disposable = np.maximum(gross_salary + net_tax - fixed, 0) / 12
 
-    # 8. Define a clean color palette
-    COLOR_PALETTE_BARS = [
-        "#1C6EB6",
-        "#61AFF3",
-        "#61AFF3",
-        "#61AFF3",
-        "#61AFF3",
-        "#ADE8F4"
-    ]
 
-    # 9. Add bars for each category
+    # --- Chart preparation and visualization
+
+    # 1. Create the stacked bar chart with Plotly
+    fig = go.Figure()
+
+    # 2. Add bars for each category (labels and palette defined above)
     fig.add_trace(go.Bar(
-        x=plot_df['Custom Label'],
-        y=plot_df['Netto Disposable'],
+        x=_CUSTOM_LABELS,
+        y=net_disposable,
         name='Net Disposable Income',
-        marker_color=COLOR_PALETTE_BARS,
-        hovertemplate='Net Disposable Income: €%{y:,.0f}<extra></extra>'
+        marker_color=_COLOR_PALETTE_BARS,
+        hoverinfo='skip'
     ))
 
-    # 10. Add annotations for the total value on top of each bar stack
-    annotations = []
-    for year, total in zip(plot_df['Custom Label'], plot_df['Netto Disposable']):
-        annotations.append(
-            dict(
-                x=year,
-                y=total,
-                text=f'€{total:,.0f}',
-                xanchor='center',
-                yanchor='bottom',
-                showarrow=False,
-                font=dict(size=12, color='white'),
-                yshift=10
-            )
+    # 3. Add annotations for the total value on top of each bar stack
+    annotations = [
+        dict(
+            x=year,
+            y=total,
+            text=f'€{total:,.0f}',
+            xanchor='center',
+            yanchor='bottom',
+            showarrow=False,
+            font=dict(size=12, color='white'),
+            yshift=10
         )
+        for year, total in zip(_CUSTOM_LABELS, net_disposable)
+    ]
 
-    # 11. Update the layout for a stacked bar style and add annotations
+    # 4. Update the layout for a stacked bar style and add annotations
     fig.update_layout(
         barmode='stack',
         title="Evolution of your disposable income",
@@ -138,8 +122,13 @@ def chart_netincome(my_dict: dict, fixed_costs, age, gross_salary, master_dpl):
         hovermode=False
     )
 
-    # 12. Display the chart in Streamlit
-    st.plotly_chart(fig, use_container_width=True)
+    # 5. Display the chart in Streamlit as a static image-like plot: values are
+    #    already annotated, so skip the hover layer and mode bar on every rerun
+    st.plotly_chart(
+        fig,
+        use_container_width=True,
+        config={"staticPlot": True, "displayModeBar": False}
+    )
 
 
 def render_pie_chart_percent_only(labels: List[str], values: List[float]):
@@ -152,21 +141,12 @@ def render_pie_chart_percent_only(labels: List[str], values: List[float]):
     - title: chart title string
     """
 
-    # 1. Define color palette and apply
-    COLOR_PALETTE_PIE = [
-        "#48CAE4",
-        "#00B4D8",
-        "#0096C7",
-        "#0077B6",
-        "#023E8A",
-        "#03045E",
-    ]
-
+    # 1. Build the donut with the shared pie palette
     fig = px.pie(
         names=labels,
         values=values,
         hole=0.4,
-        color_discrete_sequence=COLOR_PALETTE_PIE
+        color_discrete_sequence=_COLOR_PALETTE_PIE
     )
 
     # 2. Additional settings to the pie chart
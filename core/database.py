@@ -1,6 +1,8 @@
 import streamlit as st
 import sqlite3
-from typing import List, Dict
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Iterator
 from pathlib import Path
 
 DB_URI = "sqlite:///data/app.db"
@@ -12,38 +14,85 @@ def _sqlite_path(db_uri: str) -> str:
     assert db_uri.startswith("sqlite:///")
     return db_uri.replace("sqlite:///", "", 1)
 
-def _open(db_uri: str) -> sqlite3.Connection:
+# The app only reads, so one connection is shared for the whole process and
+# tuned for reads: pages are memory-mapped and kept in a 64 MB cache. The
+# journal mode is left alone; switching to WAL would rewrite the DB header.
+_READ_PRAGMAS = """
+    PRAGMA foreign_keys = ON;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -65536;
+    PRAGMA temp_store = MEMORY;
+"""
+
+# Composite indexes for the per-click rent lookups in
+# core.calculations._ESTIMATES_SQL: the NOCASE one serves the rent match,
+# the BINARY one the essential-costs average. (Salaries are read once into
+# memory, so job_positions_seniorities needs no extra index.)
+_INDEXES_SQL = """
+    CREATE INDEX IF NOT EXISTS idx_rent_city_accommodation_nocase
+        ON rental_prices(city COLLATE NOCASE, accommodation_type COLLATE NOCASE);
+    CREATE INDEX IF NOT EXISTS idx_rent_city_accommodation
+        ON rental_prices(city, accommodation_type);
+"""
+
+_LOCK = threading.Lock()
+
+def db_version(db_uri: str = DB_URI) -> int:
+    """File version (mtime in ns) used to key every cache built from the DB; 0 if missing."""
+    path = Path(_sqlite_path(db_uri))
+    return path.stat().st_mtime_ns if path.exists() else 0
+
+# Keyed on the file version too: a replaced data/app.db gets a fresh connection
+# (an open handle keeps reading the old file) and older handles are evicted
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _connect(db_uri: str, db_mtime: int) -> sqlite3.Connection:
     path = _sqlite_path(db_uri)
     Path(path).parent.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(path)
-    con.execute("PRAGMA foreign_keys = ON;")
+    con = sqlite3.connect(path, check_same_thread=False)
+    con.executescript(_READ_PRAGMAS)
+    try:
+        # No-op on the shipped data/app.db, which already has them
+        con.executescript(_INDEXES_SQL)
+    except sqlite3.OperationalError:
+        pass  # read-only database: fall back to the existing indexes
+    con.row_factory = sqlite3.Row
     return con
 
+@contextmanager
+def read_connection(db_uri: str = DB_URI) -> Iterator[sqlite3.Connection]:
+    # Shared read connection for load_options and core.calculations.
+    # Streamlit serves sessions from several threads; one query at a time.
+    with _LOCK:
+        yield _connect(db_uri, db_version(db_uri))
+
+_OPTIONS_SQL = """
+SELECT 'jobs', position_name FROM job_positions_seniorities
+UNION SELECT 'seniorities', seniority FROM job_positions_seniorities
+UNION SELECT 'cities', city FROM rental_prices
+UNION SELECT 'accommodations', accommodation_type FROM rental_prices WHERE accommodation_type IS NOT NULL
+UNION SELECT 'cars', type FROM transportation_car_costs
+ORDER BY 1, 2;
+"""
+
 def load_options(db_uri: str = DB_URI) -> Dict[str, List[str]]:
+    version = db_version(db_uri)
+    if not version:
+        return {"jobs": [], "seniorities": [], "cities": [], "accommodations": [], "cars": []}
+
+    # Cached per DB file version: reruns skip the queries, a rebuilt DB reloads
+    return _load_options_cached(db_uri, version)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_options_cached(db_uri: str, db_mtime: int) -> Dict[str, List[str]]:
     opts = {"jobs": [], "seniorities": [], "cities": [], "accommodations": [], "cars": []}
-    path = _sqlite_path(db_uri)
-    if not Path(path).exists():
-        return opts
-
-    with _open(db_uri) as con:
-        rows = con.execute("SELECT DISTINCT position_name FROM job_positions_seniorities ORDER BY position_name;").fetchall()
-        opts["jobs"] = [r[0] for r in rows]
-        rows = con.execute("SELECT DISTINCT seniority FROM job_positions_seniorities ORDER BY seniority;").fetchall()
-        opts["seniorities"] = [r[0] for r in rows]
-        rows = con.execute("SELECT DISTINCT city FROM rental_prices ORDER BY city;").fetchall()
-        opts["cities"] = [r[0] for r in rows]
-        rows = con.execute("SELECT DISTINCT accommodation_type FROM rental_prices WHERE accommodation_type IS NOT NULL ORDER BY accommodation_type;").fetchall()
-        opts["accommodations"] = [r[0] for r in rows]
-        rows = con.execute("SELECT DISTINCT type FROM transportation_car_costs ORDER BY type;").fetchall()
-        opts["cars"] = [r[0] for r in rows]
+    with read_connection(db_uri) as con:
+        # One statement for all five option lists: UNION keeps each (list, value)
+        # pair once and the ORDER BY sorts every list like the separate queries did
+        for key, value in con.execute(_OPTIONS_SQL):
+            opts[key].append(value)
 
     return opts
 
-opts = load_options(DB_URI)
-if not any(opts.values()):
-    st.error("Database not found or empty. Load it before using the app.")
-    st.stop()
-
 # Clean labels within the user input page
 def clean_label(text: str) -> str:
     return text.replace("_", " ").replace("-", " ").title() if text else text
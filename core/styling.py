@@ -2,9 +2,8 @@ import streamlit as st
 
 # ---------- Main page styling ---------- #
 
-def apply_main_page_styling():
-    """Unified blue theme for main page with sidebar + calculator visuals"""
-    st.markdown("""
+# Built once at import; re-emitted on every rerun (Streamlit drops it otherwise)
+_MAIN_CSS = """
     <style>
     /* --- Header and Toolbar --- */
     header[data-testid="stHeader"] {
@@ -111,14 +110,18 @@ def apply_main_page_styling():
     footer { display: none !important; }
     #MainMenu { visibility: hidden !important; }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+def apply_main_page_styling():
+    """Unified blue theme for main page with sidebar + calculator visuals"""
+    st.markdown(_MAIN_CSS, unsafe_allow_html=True)
 
 
 # ---------- LLM chat styling ---------- #
 
-def apply_chat_styling():
-    """Apply blue theme styling for Salary Chat page (with left-aligned big title)"""
-    st.markdown("""
+# Built once at import, same as _MAIN_CSS
+_CHAT_CSS = """
     <style>
     /* Background + header */
     header[data-testid="stHeader"] {
@@ -207,7 +210,12 @@ def apply_chat_styling():
     footer { display: none !important; }
     #MainMenu { visibility: hidden !important; }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+
+def apply_chat_styling():
+    """Apply blue theme styling for Salary Chat page (with left-aligned big title)"""
+    st.markdown(_CHAT_CSS, unsafe_allow_html=True)
 
 
 # ===== OPTIONAL ADDITIONAL COMPONENTS =====
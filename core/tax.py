@@ -1,6 +1,8 @@
-from typing import List
+import numpy as np
 import pandas as pd
+import streamlit as st
 from datetime import datetime
+from typing import Union
 
 
 def apply_ruling(base_salary: float, months_dur: int, year: int, year_seq: int):
@@ -12,28 +14,26 @@ def apply_ruling(base_salary: float, months_dur: int, year: int, year_seq: int):
     if year in (2025, 2026) and year_seq == 0:
       # 30% ruling on months applied
       gross_taxable = (base_salary - ((base_salary * 0.3) / 12 * months_dur))
-      print(gross_taxable)
     elif year in (2025, 2026) and year_seq == 1:
       # in case 2025, 2025 not first year -> full year 30% ruling
       gross_taxable = base_salary - (base_salary * 0.3)
-      print(gross_taxable)
     elif year not in (2025, 2026) and year_seq == 1:
       # in case 2026 or later and 27% ruling whole year
       gross_taxable = base_salary - (base_salary * 0.27)
-      print(gross_taxable)
     elif year not in (2025, 2026) and year_seq == 2:
       # in case 2026 or later and 30% ruling part of the year
       gross_taxable = ((base_salary - (base_salary * 0.3)) / 12 * months_dur) + (base_salary / 12 * (12 - months_dur))
-      print(gross_taxable)
     else:
       # no 30% ruling and year later than 2026
-      print(gross_taxable)
       gross_taxable = base_salary
 
     return gross_taxable
 
 # 30% ruling for expacts
+# cached per input set: reruns from unrelated widgets reuse the year dict
+# (st.cache_data hands back a copy, so callers can't mutate the cached one)
 
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
 def expat_ruling_calc(age: int,
                       base_salary: float,
                       date_string: str,
@@ -67,11 +67,7 @@ def expat_ruling_calc(age: int,
   # CREATE DICTIONARY TO KEEP VALUES IN
 
   years_sequence = list(range(current_year, current_year + duration))
-  my_dict = {}
-  my_key = years_sequence
-
-  for key in my_key:
-    my_dict[key] = ""
+  my_dict = dict.fromkeys(years_sequence, 0.0)
 
   # CHECK IF 30% RULING WILL APPLY
 
@@ -89,9 +85,6 @@ def expat_ruling_calc(age: int,
   else:
     base_salary = base_salary
 
-  keys_list = list(my_dict.keys())  # Get the tuple
-  keys = list(keys_list)  # Convert tuple to list: ['A', 'B', 'C']
-
   # CHECKING IF THERE IS A BROKEN YEAR AND CALCULATING THESE PARTS #
   ##################################################################
 
@@ -99,13 +92,13 @@ def expat_ruling_calc(age: int,
     # months_remaining_init != 12 and Ruling_test == True:
     # if start date not January
 
-    year1 = apply_ruling(base_salary, months_remaining_init, int(keys_list[0]), 0)
-    year5 = apply_ruling(base_salary, months_remaining_final, int(keys_list[4]), 2)
-    my_dict[keys[0]] = year1
-    my_dict[keys[4]] = year5
+    year1 = apply_ruling(base_salary, months_remaining_init, years_sequence[0], 0)
+    year5 = apply_ruling(base_salary, months_remaining_final, years_sequence[4], 2)
+    my_dict[years_sequence[0]] = year1
+    my_dict[years_sequence[4]] = year5
 
     # other years -not first and last years
-    other_years_sequence = list(keys_list[1:5])
+    other_years_sequence = years_sequence[1:5]
 
     for key in other_years_sequence:
       if key >= 2027:
@@ -116,7 +109,7 @@ def expat_ruling_calc(age: int,
         my_dict[key] = apply_ruling(base_salary, 12, int(key), 1)
 
     # populating remainder of the dictionary - no ruling
-    for key in keys_list[5:]:
+    for key in years_sequence[5:]:
       my_dict[key] = float(base_salary)
 
     return my_dict
@@ -124,63 +117,87 @@ def expat_ruling_calc(age: int,
   else:
     # not applicable - not fulfilling conditions
     # populating remainder of the dictionary - no ruling
-    for key in keys_list:
+    for key in years_sequence:
       my_dict[key] = float(base_salary)
 
     return my_dict
 
 
-def calc_tax(gross_salary: float) -> float:
+# ----- Calculate income tax (box 1)
+
+# Schijven en tarieven box 1 2025
+BOX1_GRENS_1 = 38_441.00    # Einde schijf 1
+BOX1_GRENS_2 = 76_817.00    # Einde schijf 2
+
+BOX1_TARIEF_1 = 0.3582      # 35,82% in schijf 1
+BOX1_TARIEF_2 = 0.3748      # 37,48% in schijf 2
+BOX1_TARIEF_3 = 0.4950      # 49,50% in schijf 3
+
+# Same brackets as flat arrays for calc_tax_vec
+_LOWERS = np.array([0.0, BOX1_GRENS_1, BOX1_GRENS_2])
+_UPPERS = np.array([BOX1_GRENS_1, BOX1_GRENS_2, np.inf])
+_RATES = np.array([BOX1_TARIEF_1, BOX1_TARIEF_2, BOX1_TARIEF_3])
+
+
+def calc_tax(gross_salary: Union[float, np.ndarray, pd.Series]) -> Union[float, np.ndarray, pd.Series]:
+    """
+    2025 Box 1 income tax, rounded to cents. A float gives a float; a NumPy
+    array or pandas Series is taxed element-wise and returned as the same type.
+    """
+
+    # --- 0) Whole columns: hand off to the vectorised version (no .apply)
+    if isinstance(gross_salary, pd.Series):
+        return pd.Series(calc_tax_vec(gross_salary.to_numpy()),
+                         index=gross_salary.index, name=gross_salary.name)
+    if isinstance(gross_salary, np.ndarray):
+        return calc_tax_vec(gross_salary)
 
     # --- 1) Guardrail: input should be non-negative
     if gross_salary < 0:
         raise ValueError("gross_salary must be non-negative")
 
-    # --- 2) Define the 2025 Box 1 brackets as (upper_limit, rate)
-    # Bracket 1: 0        .. 38,441  -> 35.82%
-    # Bracket 2: 38,441   .. 76,817  -> 37.48%
-    # Bracket 3: 76,817   .. +inf    -> 49.50%
-    # We implement these as cumulative upper bounds. The last one is infinity.
-    brackets: List[Tuple[float, float]] = [
-        (38_441.00, 0.3582),
-        (76_817.00, 0.3748),
-        (float("inf"), 0.4950),
-    ]
-
-    # assume taxable income is gross salary
-    taxable_income = gross_salary
-
-    # Walk the brackets and accumulate tax per slice
-    tax = 0.0
-    lower_limit = 0.0
-
-    for upper_limit, rate in brackets:
-        # Income that falls inside THIS bracket:
-        #   from the current lower_limit up to the bracket's upper_limit,
-        #   but never exceeding taxable_income.
-        slice_amount = max(0.0, min(taxable_income, upper_limit) - lower_limit)
-        if slice_amount <= 0:
-            # No taxable income left for this or further brackets.
-            break
-        # Tax for this slice = slice_amount * rate
-        tax += slice_amount * rate
-        # Move the lower bound up to this bracket's upper limit
-        lower_limit = upper_limit
-        # If we've already taxed the entire taxable_income, stop early
-        if taxable_income <= upper_limit:
-            break
-
-    # Net income = full gross - tax
-    net_income = gross_salary - tax
+    # --- 2) 2025 Box 1 brackets (BOX1_* constants above)
+    # Each bracket taxes the slice of income that falls inside it, so the
+    # total is a closed-form sum of three clamped slices (no bracket walk).
+    tax = (
+        min(gross_salary, BOX1_GRENS_1) * BOX1_TARIEF_1
+        + max(0.0, min(gross_salary, BOX1_GRENS_2) - BOX1_GRENS_1) * BOX1_TARIEF_2
+        + max(0.0, gross_salary - BOX1_GRENS_2) * BOX1_TARIEF_3
+    )
 
     # Return with cents precision
-    print(round(tax, 2))
     return round(tax, 2)
-calc_tax(74400)
+
+
+def calc_tax_vec(income: np.ndarray) -> np.ndarray:
+    """
+    Vectorised calc_tax: 2025 Box 1 tax for a whole array of gross salaries,
+    using the same clamped bracket slices in a single NumPy pass.
+    """
+    income = np.asarray(income, dtype=float)
+    if (income < 0).any():
+        raise ValueError("gross_salary must be non-negative")
+
+    # Slice of each income inside each bracket (one column per bracket), taxed
+    # at that bracket's rate and summed
+    slices = np.clip(np.minimum(income[..., None], _UPPERS) - _LOWERS, 0.0, None)
+    tax = (slices * _RATES).sum(axis=-1)
+    return np.round(tax, 2)
 
 
 # ----- Calculate tax discount (arbeitskorting)
 
+# Grenzen en tarieven arbeidskorting 2025
+AK_GRENS_1 = 11491    # Ondergrens voor arbeidskorting
+AK_GRENS_2 = 24821    # Einde opbouwfase
+AK_GRENS_3 = 39958    # Einde plateau
+AK_GRENS_4 = 124934   # Bovengrens arbeidskorting
+
+AK_OPBOUW_TARIEF = 0.3115    # 31,15% opbouw in fase 2
+AK_MAX_KORTING = 4152        # Maximum arbeidskorting (plateau)
+AK_AFBOUW_TARIEF = 0.06      # 6% afbouw in fase 4
+
+
 def bereken_arbeidskorting(salaris):
     """
     Berekent de arbeidskorting voor Nederland 2025 op basis van het brutosalaris.
@@ -196,39 +213,29 @@ def bereken_arbeidskorting(salaris):
         float: De arbeidskorting in euro's
     """
 
-    # Grenzen en tarieven arbeidskorting 2025
-    GRENS_1 = 11491    # Ondergrens voor arbeidskorting
-    GRENS_2 = 24821    # Einde opbouwfase
-    GRENS_3 = 39958    # Einde plateau
-    GRENS_4 = 124934   # Bovengrens arbeidskorting
-
-    OPBOUW_TARIEF = 0.3115    # 31,15% opbouw in fase 2
-    MAX_KORTING = 4152        # Maximum arbeidskorting (plateau)
-    AFBOUW_TARIEF = 0.06      # 6% afbouw in fase 4
-
     # Input validatie
     if salaris < 0:
         raise ValueError("Salaris kan niet negatief zijn")
 
     # Fase 1: €0 - €11.491 (geen korting)
-    if salaris <= GRENS_1:
+    if salaris <= AK_GRENS_1:
         return 0.0
 
     # Fase 2: €11.491 - €24.821 (opbouw 31,15%)
-    elif salaris <= GRENS_2:
-        opbouw_bedrag = salaris - GRENS_1
-        korting = opbouw_bedrag * OPBOUW_TARIEF
+    elif salaris <= AK_GRENS_2:
+        opbouw_bedrag = salaris - AK_GRENS_1
+        korting = opbouw_bedrag * AK_OPBOUW_TARIEF
         return round(korting, 2)
 
     # Fase 3: €24.821 - €39.958 (plateau €4.152)
-    elif salaris <= GRENS_3:
-        return MAX_KORTING
+    elif salaris <= AK_GRENS_3:
+        return AK_MAX_KORTING
 
     # Fase 4: €39.958 - €124.934 (afbouw 6%)
-    elif salaris <= GRENS_4:
-        afbouw_bedrag = salaris - GRENS_3
-        afbouw = afbouw_bedrag * AFBOUW_TARIEF
-        korting = MAX_KORTING - afbouw
+    elif salaris <= AK_GRENS_4:
+        afbouw_bedrag = salaris - AK_GRENS_3
+        afbouw = afbouw_bedrag * AK_AFBOUW_TARIEF
+        korting = AK_MAX_KORTING - afbouw
         return round(max(korting, 0), 2)  # Minimum 0
 
     # Boven €124.934: geen arbeidskorting meer
@@ -236,8 +243,37 @@ def bereken_arbeidskorting(salaris):
         return 0.0
 
 
+def bereken_arbeidskorting_vec(salarissen: np.ndarray) -> np.ndarray:
+    """
+    Gevectoriseerde bereken_arbeidskorting: dezelfde 4 fases, in één keer
+    berekend over een array van bruto jaarsalarissen met np.select.
+    """
+    s = np.asarray(salarissen, dtype=float)
+    if (s < 0).any():
+        raise ValueError("Salaris kan niet negatief zijn")
+
+    korting = np.select(
+        [s <= AK_GRENS_1, s <= AK_GRENS_2, s <= AK_GRENS_3, s <= AK_GRENS_4],
+        [
+            0.0,                                                              # Fase 1
+            (s - AK_GRENS_1) * AK_OPBOUW_TARIEF,                              # Fase 2
+            AK_MAX_KORTING,                                                   # Fase 3
+            np.maximum(AK_MAX_KORTING - (s - AK_GRENS_3) * AK_AFBOUW_TARIEF, 0),  # Fase 4
+        ],
+        default=0.0,                                                          # Boven €124.934
+    )
+    return np.round(korting, 2)
+
+
 # ----- Return tax discount (algemene heffingskorting)
 
+# Grenzen en tarieven algemene heffingskorting 2025
+AHK_MAXIMUM_KORTING = 3362      # Maximum algemene heffingskorting
+AHK_AFBOUW_ONDERGRENS = 24812   # Vanaf dit bedrag begint afbouw
+AHK_AFBOUW_BOVENGRENS = 76421   # Boven dit bedrag is er geen korting meer
+AHK_AFBOUW_TARIEF = 0.06007     # 6,007% afbouw per euro boven de ondergrens
+
+
 def bereken_algemene_heffingskorting(salaris):
     """
     Berekent de algemene heffingskorting voor Nederland 2025 op basis van het brutosalaris.
@@ -252,25 +288,19 @@ def bereken_algemene_heffingskorting(salaris):
         float: De algemene heffingskorting in euro's
     """
 
-    # Grenzen en tarieven algemene heffingskorting 2025
-    MAXIMUM_KORTING = 3362      # Maximum algemene heffingskorting
-    AFBOUW_ONDERGRENS = 24812   # Vanaf dit bedrag begint afbouw
-    AFBOUW_BOVENGRENS = 76421   # Boven dit bedrag is er geen korting meer
-    AFBOUW_TARIEF = 0.06007     # 6,007% afbouw per euro boven de ondergrens
-
     # Input validatie
     if salaris < 0:
         raise ValueError("Salaris kan niet negatief zijn")
 
     # Fase 1: €0 - €24.812 (volledige korting)
-    if salaris <= AFBOUW_ONDERGRENS:
-        return MAXIMUM_KORTING
+    if salaris <= AHK_AFBOUW_ONDERGRENS:
+        return AHK_MAXIMUM_KORTING
 
     # Fase 2: €24.812 - €76.421 (afbouw 6,007%)
-    elif salaris <= AFBOUW_BOVENGRENS:
-        afbouw_bedrag = salaris - AFBOUW_ONDERGRENS
-        afbouw = afbouw_bedrag * AFBOUW_TARIEF
-        korting = MAXIMUM_KORTING - afbouw
+    elif salaris <= AHK_AFBOUW_BOVENGRENS:
+        afbouw_bedrag = salaris - AHK_AFBOUW_ONDERGRENS
+        afbouw = afbouw_bedrag * AHK_AFBOUW_TARIEF
+        korting = AHK_MAXIMUM_KORTING - afbouw
         return round(max(korting, 0), 2)  # Minimum 0
 
     # Fase 3: Boven €76.421 (geen korting meer)
@@ -278,111 +308,118 @@ def bereken_algemene_heffingskorting(salaris):
         return 0.0
 
 
-def return_net_income(my_dict: dict, fixed_costs):
-
-###############################################################################
-############################ RETURN NET INCOME YEAR 1##########################
-###############################################################################
+def bereken_algemene_heffingskorting_vec(salarissen: np.ndarray) -> np.ndarray:
+    """
+    Gevectoriseerde bereken_algemene_heffingskorting: dezelfde 3 fases, in één
+    keer berekend over een array van bruto jaarsalarissen met np.select.
+    """
+    s = np.asarray(salarissen, dtype=float)
+    if (s < 0).any():
+        raise ValueError("Salaris kan niet negatief zijn")
 
-# CONVERTING TO PANDA DATAFRAME AND ADDING OTHER PARAMETERS
-    df = pd.DataFrame(list(my_dict.items()), columns=["Year", "Taxable Income"])
+    korting = np.select(
+        [s <= AHK_AFBOUW_ONDERGRENS, s <= AHK_AFBOUW_BOVENGRENS],
+        [
+            AHK_MAXIMUM_KORTING,                                                                  # Fase 1
+            np.maximum(AHK_MAXIMUM_KORTING - (s - AHK_AFBOUW_ONDERGRENS) * AHK_AFBOUW_TARIEF, 0),  # Fase 2
+        ],
+        default=0.0,                                                                              # Fase 3
+    )
+    return np.round(korting, 2)
 
-# ADDING FIXED COSTS FROM DICTIONARY
-    df["Fixed Costs"] = fixed_costs
 
-# CALCULATING TAX
-    df["Tax"] = round(-df["Taxable Income"].apply(calc_tax), 0)
+# ----- Shared income frame
 
-# CALCULATING DEDUCTABLES
-    df["Arbeidskorting"] = round(df["Taxable Income"].apply(bereken_arbeidskorting),0)
-    df["Algemene Heffingskorting"] = round(df["Taxable Income"].apply(bereken_algemene_heffingskorting),0)
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
+def build_income_frame(my_dict_items: tuple, fixed_costs, gross_salary=None) -> pd.DataFrame:
+    """
+    Builds the year-by-year tax frame shared by the income helpers below and
+    by chart_netincome: taxable income, fixed costs, tax, both credits, gross
+    salary (when given) and net tax. The helpers only differ in what they read
+    from it, so it is computed once per input and cached across reruns.
 
-# CALCULATING NET TAX
-    df["Net Tax"] = - (abs(df["Tax"]) - (df["Arbeidskorting"] + df["Algemene Heffingskorting"]))
+    Args:
+        my_dict_items (tuple): my_dict.items() as a tuple, so it is hashable.
+        fixed_costs (float): Annual fixed costs.
+        gross_salary (float, optional): Annual gross salary.
+    Returns:
+        pd.DataFrame: One row per year.
+    """
 
-# CALCULATING NETTO INCOME AFTER TAX & FIXED EXPENSES
-    df["Netto Disposable"] = df["Taxable Income"] + df["Net Tax"] - df["Fixed Costs"]
-    df.loc[df["Netto Disposable"] < 0, "Netto Disposable"] = 0
+    # Convert the (year, taxable income) pairs to typed columns directly
+    years = np.fromiter((year for year, _ in my_dict_items), dtype=np.int64, count=len(my_dict_items))
+    income = np.fromiter((value for _, value in my_dict_items), dtype=np.float64, count=len(my_dict_items))
 
-    return df["Netto Disposable"].iloc[0]
+    # Calculate taxes and deductions
+    tax = np.round(-calc_tax_vec(income), 0)
+    arbeidskorting = np.round(bereken_arbeidskorting_vec(income), 0)
+    heffingskorting = np.round(bereken_algemene_heffingskorting_vec(income), 0)
 
+    # Calculate net tax (tax is already negative, credits bring it back up)
+    net_tax_arr = tax + arbeidskorting + heffingskorting
 
-def netincome(my_dict: dict, fixed_costs, gross_salary):
+    # Build the frame in one go (column by column inserts fragment it)
+    columns = {
+        "Year": years,
+        "Taxable Income": income,
+        "Fixed Costs": fixed_costs,
+        "Tax": tax,
+        "Arbeidskorting": arbeidskorting,
+        "Algemene Heffingskorting": heffingskorting,
+    }
+    if gross_salary is not None:
+        columns["Gross Salary"] = gross_salary
+    columns["Net Tax"] = net_tax_arr
 
-    # Convert the dictionary to a Pandas DataFrame
-    df = pd.DataFrame(list(my_dict.items()), columns=["Year", "Taxable Income"])
+    df = pd.DataFrame(columns)
 
-    # Add fixed costs to the DataFrame
-    df["Fixed Costs"] = fixed_costs
+    return df
 
-    # Calculate taxes and deductions
-    df["Tax"] = round(-df["Taxable Income"].apply(calc_tax), 0)
-    df["Arbeidskorting"] = round(df["Taxable Income"].apply(bereken_arbeidskorting), 0)
-    df["Algemene Heffingskorting"] = round(df["Taxable Income"].apply(bereken_algemene_heffingskorting), 0)
-    df["Gross Salary"] = gross_salary
-    # Calculate net tax
-    df["Net Tax"] = - (abs(df["Tax"]) - (df["Arbeidskorting"] + df["Algemene Heffingskorting"]))
 
-    # Calculate net disposable income after tax and expenses
-    # df["Netto Disposable"] = df["Taxable Income"] + df["Net Tax"] - df["Fixed Costs"]
+def return_net_income(my_dict: dict, fixed_costs):
 
+###############################################################################
+############################ RETURN NET INCOME YEAR 1##########################
+###############################################################################
 
-    df["Netto Disposable"] = df["Gross Salary"] + df["Net Tax"]
+# TAX FRAME (TAXABLE INCOME, FIXED COSTS, TAX, DEDUCTABLES, NET TAX)
+    df = build_income_frame(tuple(my_dict.items()), fixed_costs)
 
-    print(df)
+# CALCULATING NETTO INCOME AFTER TAX & FIXED EXPENSES
+    df["Netto Disposable"] = (
+        df["Taxable Income"] + df["Net Tax"] - df["Fixed Costs"]
+    ).clip(lower=0)
 
     return df["Netto Disposable"].iloc[0]
 
-def netto_disposable(my_dict: dict, fixed_costs, gross_salary):
 
-    # Convert the dictionary to a Pandas DataFrame
-    df = pd.DataFrame(list(my_dict.items()), columns=["Year", "Taxable Income"])
+def netincome(my_dict: dict, fixed_costs, gross_salary):
 
-    # Add fixed costs to the DataFrame
-    df["Fixed Costs"] = fixed_costs
+    # Shared tax frame for these inputs
+    df = build_income_frame(tuple(my_dict.items()), fixed_costs, gross_salary)
 
-    # Calculate taxes and deductions
-    df["Tax"] = round(-df["Taxable Income"].apply(calc_tax), 0)
-    df["Arbeidskorting"] = round(df["Taxable Income"].apply(bereken_arbeidskorting), 0)
-    df["Algemene Heffingskorting"] = round(df["Taxable Income"].apply(bereken_algemene_heffingskorting), 0)
-    df["Gross Salary"] = gross_salary
-    # Calculate net tax
-    df["Net Tax"] = - (abs(df["Tax"]) - (df["Arbeidskorting"] + df["Algemene Heffingskorting"]))
+    # Net income: gross salary plus (negative) net tax
+    df["Netto Disposable"] = df["Gross Salary"] + df["Net Tax"]
 
-    # Calculate net disposable income after tax and expenses
-    # df["Netto Disposable"] = df["Taxable Income"] + df["Net Tax"] - df["Fixed Costs"]
+    return df["Netto Disposable"].iloc[0]
 
+def netto_disposable(my_dict: dict, fixed_costs, gross_salary):
 
-    df["Netto Disposable"] = df["Gross Salary"] + df["Net Tax"]
+    # Shared tax frame for these inputs
+    df = build_income_frame(tuple(my_dict.items()), fixed_costs, gross_salary)
 
+    # Monthly net income per year
+    df["Netto Disposable"] = (df["Gross Salary"] + df["Net Tax"]) / 12
 
-    df["Netto Disposable"] = df["Netto Disposable"]/12
-    print(df)
     return df.set_index("Year")["Netto Disposable"].to_dict()
 
 def net_tax(my_dict: dict, fixed_costs, gross_salary):
 
-    # Convert the dictionary to a Pandas DataFrame
-    df = pd.DataFrame(list(my_dict.items()), columns=["Year", "Taxable Income"])
-
-    # Add fixed costs to the DataFrame
-    df["Fixed Costs"] = fixed_costs
-
-    # Calculate taxes and deductions
-    df["Tax"] = round(-df["Taxable Income"].apply(calc_tax), 0)
-    df["Arbeidskorting"] = round(df["Taxable Income"].apply(bereken_arbeidskorting), 0)
-    df["Algemene Heffingskorting"] = round(df["Taxable Income"].apply(bereken_algemene_heffingskorting), 0)
-    df["Gross Salary"] = gross_salary
-    # Calculate net tax
-    df["Net Tax"] = - (abs(df["Tax"]) - (df["Arbeidskorting"] + df["Algemene Heffingskorting"]))
-
-    # Calculate net disposable income after tax and expenses
-    # df["Netto Disposable"] = df["Taxable Income"] + df["Net Tax"] - df["Fixed Costs"]
-
+    # Shared tax frame for these inputs
+    df = build_income_frame(tuple(my_dict.items()), fixed_costs, gross_salary)
 
+    # Monthly net tax per year
     df["Netto Disposable"] = (df["Gross Salary"] + df["Net Tax"])
     df["Net Tax"] = df["Net Tax"]/12
 
-    print(df)
-
     return df.set_index("Year")["Net Tax"].to_dict()
@@ -3,8 +3,11 @@
 import streamlit as st
 from pathlib import Path
 import asyncio
+import hashlib
+import itertools
 import os
 import re
+import time
 from dotenv import load_dotenv
 from langchain_core.prompts import ChatPromptTemplate
 from langchain.prompts import PromptTemplate
@@ -12,8 +15,6 @@ from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_community.document_loaders import TextLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_core.vectorstores import InMemoryVectorStore
-from typing_extensions import TypedDict
-from langgraph.graph import START, StateGraph
 from core.styling import apply_chat_styling
 
 
@@ -40,19 +41,37 @@ except ImportError:
 
 # ---------- LLM and Vector initialization --------- #
 
+CHAT_MODEL = "gemini-2.5-flash"
+
 @st.cache_resource(show_spinner=True)
 def load_llm():
     if not HAS_LLM:
         return None
     try:
-        return init_chat_model("gemini-2.5-flash", model_provider="google_genai")
+        return init_chat_model(CHAT_MODEL, model_provider="google_genai")
     except Exception as e:
         st.sidebar.error(f":warning: Could not load LLM: {e}")
         return None
 llm = load_llm()
 
+EMBEDDING_MODEL = "models/text-embedding-004"
+CHUNK_SIZE = 1000
+CHUNK_OVERLAP = 200
+RAG_DATA_DIR = Path.cwd() / "data" / "RAG"
+RAG_CACHE_DIR = Path.cwd() / ".cache" / "rag"
+
+def _rag_fingerprint(md_files, *settings) -> str:
+    """Hash of the RAG docs and the settings that shape a cache file, used to name it."""
+    digest = hashlib.sha256("|".join(map(str, settings)).encode())
+    for md_file in md_files:
+        digest.update(md_file.name.encode())
+        digest.update(md_file.read_bytes())
+    return digest.hexdigest()[:16]
+
 @st.cache_resource(show_spinner=True)
-def load_vector_store():
+def load_vector_store(index_id: str):
+    # index_id: fingerprint of the docs + embedding settings, so edited docs
+    # get a new in-process index (and a new disk cache file)
     try:
         try:
             asyncio.get_running_loop()
@@ -60,32 +79,48 @@ def load_vector_store():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
 
-        DATA_DIR = Path.cwd() / "data" / "RAG"
+        md_files = sorted(RAG_DATA_DIR.glob("*.md"))
+        embeddings = GoogleGenerativeAIEmbeddings(model=EMBEDDING_MODEL)
+
+        # Reuse the embedded index from disk while the docs and settings match
+        cache_file = RAG_CACHE_DIR / f"rag_{index_id}.json"
+        if cache_file.exists():
+            try:
+                return InMemoryVectorStore.load(str(cache_file), embeddings)
+            except Exception:
+                pass # Unreadable cache: rebuild it below
+
         docs = []
-        for md_file in DATA_DIR.glob("*.md"):
+        for md_file in md_files:
             loader = TextLoader(str(md_file), encoding="utf-8")
             docs.extend(loader.load())
 
         if not docs:
             st.sidebar.warning("⚠️ No .md documents found in data/RAG.")
 
-        text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+        text_splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
         all_splits = text_splitter.split_documents(docs)
 
-        embeddings = GoogleGenerativeAIEmbeddings(model="models/text-embedding-004")
         vector_store = InMemoryVectorStore(embeddings)
         vector_store.add_documents(all_splits)
 
+        try:
+            RAG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            vector_store.dump(str(cache_file))
+        except OSError:
+            pass # Read-only deploys just skip the disk cache
+
         return vector_store
 
     except Exception as e:
         st.sidebar.error(f"⚠️ Could not initialize RAG: {e}")
         return None
 
-vector_store = load_vector_store()
+RAG_INDEX_ID = _rag_fingerprint(sorted(RAG_DATA_DIR.glob("*.md")), EMBEDDING_MODEL, CHUNK_SIZE, CHUNK_OVERLAP)
+vector_store = load_vector_store(RAG_INDEX_ID)
 
 
-# ---------- Prompt and State definition --------- #
+# ---------- Prompt definition --------- #
 
 if HAS_LLM and llm and vector_store:
     rag_prompt = ChatPromptTemplate.from_messages([
@@ -113,20 +148,19 @@ if HAS_LLM and llm and vector_store:
         "User's question: {question}")
     ])
 
-    class State(TypedDict):
-        question: str
-        context: str
-        answer: str
-
 
 # ---------- RAG helper functions --------- #
 
 # 1. Text cleaning
+_MD_HEADER_RE = re.compile(r'^#+ .*$', flags=re.MULTILINE)
+_MD_FORMAT_RE = re.compile(r'[*_`]')
+_MD_NEWLINE_RE = re.compile(r'\n{2,}')
+
 def clean_text(text: str) -> str:
     """Remove markdown headers, formatting, and excessive whitespace."""
-    text = re.sub(r'^#+ .*$', '', text, flags=re.MULTILINE) # Remove markdown headers
-    text = re.sub(r'[*_`]', '', text) # Remove bold/italic markdown markers
-    text = re.sub(r'\n{2,}', '\n', text) # Collapse multiple newlines
+    text = _MD_HEADER_RE.sub('', text) # Remove markdown headers
+    text = _MD_FORMAT_RE.sub('', text) # Remove bold/italic markdown markers
+    text = _MD_NEWLINE_RE.sub('\n', text) # Collapse multiple newlines
     return text.strip()
 
 # 2. Document retrieval
@@ -146,11 +180,26 @@ def retrieve_docs(query, vector_store, filters=None, k=3):
     if filters:
         docs = vector_store.similarity_search(query, k=k, filter=filters)
     else:
-        docs = vector_store.similarity_search(query, k=k)
+        docs = _similarity_search_cached(query, k, RAG_INDEX_ID, vector_store)
     return docs
 
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def _similarity_search_cached(query, k, index_id, _vector_store):
+    """
+    Unfiltered search cached per (query, k, index): repeat and FAQ questions
+    skip the query embedding call, and a rebuilt index never serves old hits.
+    """
+    return _vector_store.similarity_search(query, k=k)
+
+
 # 3. Document compression
+COMPRESSION_PROMPT = (
+    "Summarize the following text into 4-5 sentences in plain language. "
+    "Do not include section titles, bullet points, or references. "
+    "Keep only the essential rules, thresholds, and key numbers.\n\n{text}"
+)
+
 def compress_docs(docs, llm):
     """
     Summarize retrieved documents into a concise paragraph.
@@ -163,16 +212,74 @@ def compress_docs(docs, llm):
         str: A summarized version of the combined documents.
     """
     combined_text = "\n\n".join([clean_text(doc.page_content) for doc in docs])
-    compression_prompt = PromptTemplate.from_template(
-        "Summarize the following text into 4-5 sentences in plain language. "
-        "Do not include section titles, bullet points, or references. "
-        "Keep only the essential rules, thresholds, and key numbers.\n\n{text}"
-    )
+    compression_prompt = PromptTemplate.from_template(COMPRESSION_PROMPT)
 
     summary = llm.invoke(compression_prompt.format(text=combined_text))
     return summary.content if hasattr(summary, "content") else str(summary)
 
 
+SUMMARY_RETRY_SECONDS = 600 # Back-off before a failed file is summarized again
+
+
+@st.cache_resource(show_spinner=False)
+def _summary_failures():
+    """Last failure time per summary id, shared by every session of this process."""
+    return {}
+
+
+@st.cache_resource(show_spinner=True)
+def _summarize_file(file_name: str, summary_id: str) -> str:
+    # summary_id: fingerprint of the file + CHAT_MODEL + COMPRESSION_PROMPT.
+    # Failures raise instead of returning, so st.cache_resource keeps only successes.
+    cache_file = RAG_CACHE_DIR / f"summary_{summary_id}.txt"
+    if cache_file.exists():
+        try:
+            return cache_file.read_text(encoding="utf-8")
+        except OSError:
+            pass # Unreadable cache: summarize again below
+
+    docs = TextLoader(str(RAG_DATA_DIR / file_name), encoding="utf-8").load()
+    summary = compress_docs(docs, llm)
+
+    try:
+        RAG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(summary, encoding="utf-8")
+    except OSError:
+        pass # Read-only deploys just skip the disk cache
+
+    return summary
+
+
+def load_doc_summaries():
+    """
+    Summarize every knowledge base file once, so answering a question only
+    needs the final LLM call. Each file's summary is cached on its own (in
+    memory and next to the embedding cache) and reused until that file, the
+    prompt or the chat model change.
+
+    Returns:
+        dict: Summary per file name. Files that failed are left out (their
+        cleaned passage is used instead) and retried after SUMMARY_RETRY_SECONDS.
+    """
+    if not (llm and vector_store):
+        return {} # No retrieval without both, so summaries would never be read
+
+    failures = _summary_failures()
+    summaries = {}
+    for md_file in sorted(RAG_DATA_DIR.glob("*.md")):
+        summary_id = _rag_fingerprint([md_file], CHAT_MODEL, COMPRESSION_PROMPT)
+        if time.monotonic() - failures.get(summary_id, float("-inf")) < SUMMARY_RETRY_SECONDS:
+            continue # Failed recently: keep using its passage until the back-off ends
+        try:
+            summaries[md_file.name] = _summarize_file(md_file.name, summary_id)
+        except Exception:
+            failures[summary_id] = time.monotonic()
+
+    return summaries
+
+doc_summaries = load_doc_summaries()
+
+
 # 4. Context preparation
 SOURCE_LABELS = {
     "health_insurance.md": "Rijksoverheid",
@@ -185,46 +292,56 @@ SOURCE_LABELS = {
 }
 
 
-def prepare_context(query, vector_store, llm, filters=None):
+SNIPPET_CHARS = 600
+
+
+def prepare_context(query, vector_store, filters=None):
     """
-    Retrieve and compress relevant context for a user query.
+    Retrieve relevant context for a user query, using the precomputed
+    document summaries (or short cleaned passages) so no LLM call is needed.
 
     Args:
         query (str): The user’s question.
         vector_store: The in-memory vector store.
-        llm: The loaded language model.
         filters (dict, optional): Metadata filters.
 
     Returns:
-        tuple(str, list): Compressed text summary and list of source labels.
+        tuple(str, list): Context text and list of source labels.
     """
     docs = retrieve_docs(query, vector_store, filters=filters, k=3)
     if not docs:
-        return "" # Specific for handling error with empty docs
-    compressed = compress_docs(docs, llm)
-    sources = []
-    for doc in docs:
-        filename = Path(doc.metadata.get("source", "unknown")).name
-        sources.append(SOURCE_LABELS.get(filename, filename))
+        return "", [] # Specific for handling error with empty docs
+    filenames = [Path(doc.metadata.get("source", "unknown")).name for doc in docs]
+
+    # Precomputed summary per file, or the cleaned passage itself (truncated)
+    # when a file has none: never an extra LLM call before the answer
+    parts = []
+    for doc, filename in zip(docs, filenames):
+        if filename in doc_summaries:
+            parts.append(doc_summaries[filename])
+        else:
+            parts.append(clean_text(doc.page_content)[:SNIPPET_CHARS])
+    compressed = "\n\n".join(dict.fromkeys(parts))
+
+    sources = [SOURCE_LABELS.get(filename, filename) for filename in filenames]
     return compressed, sources
 
 # 5. Answer generation
-def generate(state: State):
+def build_messages(question: str):
     """
-    Execute the full RAG generation process:
+    Build the final prompt for a question:
     1. Retrieve relevant documents.
-    2. Summarize them.
+    2. Use their precomputed summaries as context.
     3. Combine with user profile.
-    4. Invoke LLM for explanation.
 
     Args:
-        state (State): Dictionary containing the user question.
+        question (str): User question.
 
     Returns:
-        dict: Generated answer and the list of sources used.
+        tuple(list, list): Prompt messages and list of sources used.
     """
-    # Retrieve compressed context (summaries of top docs)
-    context, sources_used = prepare_context(state["question"], vector_store, llm)
+    # Retrieve context (summaries of top docs, no extra LLM call)
+    context, sources_used = prepare_context(question, vector_store)
 
     # Format user info for the prompt
     user_info = st.session_state.get("last_payload")
@@ -249,45 +366,52 @@ def generate(state: State):
 
     # Build final prompt
     messages = rag_prompt.invoke({
-        "question": state["question"],
-        "context": context,  # compressed context here
+        "question": question,
+        "context": context,  # summaries / passages of the top docs
         "user_info": user_context
     })
-    response = llm.invoke(messages)
-
-    return {
-        "answer": response.content.strip(),
-        "sources": sorted(set(sources_used)) # Not showing to the user
-    }
-
-
-# 6. Chain compilation and question-answer flowchart
-graph_builder = StateGraph(State).add_sequence([generate])
-graph_builder.add_edge(START, "generate")
-rag_chain = graph_builder.compile()
+    return messages, sources_used
 
 
-def rag_answer(question: str):
+# 6. Answer streaming
+def rag_answer_stream(question: str):
     """
-    Public API for answering user queries via RAG.
+    Public API for answering user queries via RAG: yields the answer text as
+    the model writes it, so the first words show up before generation finishes.
 
     Args:
         question (str): User question.
 
-    Returns:
-        dict: Contains the model's answer (and optionally sources).
+    Yields:
+        str: Pieces of the model's answer (or a single warning message).
     """
-    if not rag_chain:
-        return {"answer": "⚠️ RAG not available."}
+    if not (HAS_LLM and llm and vector_store):
+        yield "⚠️ RAG not available."
+        return
     try:
-        result = rag_chain.invoke({"question": question})
-        answer = result.get("answer", "").strip()
-        if not answer:
-            return {"answer": "⚠️ No relevant information was found in the knowledge base."}
-        return {"answer": answer}
+        messages, _ = build_messages(question)
+        has_answer = False
+        for chunk in llm.stream(messages):
+            if chunk.content:
+                has_answer = True
+                yield chunk.content
+        if not has_answer:
+            yield "⚠️ No relevant information was found in the knowledge base."
     except Exception as e:
         print(f"RAG error: {e}")
-        return {"answer": "⚠️ Something went wrong while retrieving information. Please try again."}
+        yield "⚠️ Something went wrong while retrieving information. Please try again."
+
+
+def show_answer(question: str):
+    """Stream the answer on the page, then keep it in the usual success box."""
+    placeholder = st.empty()
+    # Retrieval and the wait for the first token happen under the spinner
+    with st.spinner("Connecting the dots..."):
+        stream = rag_answer_stream(question)
+        first_chunk = next(stream, "")
+    with placeholder.container():
+        answer = st.write_stream(itertools.chain([first_chunk], stream))
+    placeholder.success(answer)
 
 
 # ---------- Page setup and UI --------- #
@@ -309,13 +433,9 @@ st.write(":bulb: Suggested questions:")
 
 for q in faq:
     if st.button(q):
-        with st.spinner("Connecting the dots..."):
-            result = rag_answer(q)
-        st.success(result["answer"])
+        show_answer(q)
 
 # 3. User input
 user_input = st.text_input("Or type your own question:")
 if user_input:
-    with st.spinner("Connecting the dots..."):
-        result = rag_answer(user_input)
-    st.success(result["answer"])
+    show_answer(user_input)